@@ -3,14 +3,54 @@ import ast
 import json
 import time
 import re
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
+from . import __version__
 from .utils import load_json, save_json
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 STATE_DIR_NAME = '.kylo'
 STATE_FILE = 'state.json'
 CONTEXT_FILE = 'context.json'
+AUDIT_CACHE_FILE = os.path.join('cache', 'audit', 'index.json')
+
+# Loaded lazily by _gemini_analyzer() so plain audits never import it
+_GEMINI = None
+
+# Spawning a pool costs ~120 ms against ~2 ms to audit a typical file, so
+# below this many files the pool costs more to start than it saves
+PARALLEL_THRESHOLD = 100
+
+IGNORED_DIRS = frozenset(['.git', '.kylo', '__pycache__', 'node_modules', 'venv', '.venv', 'env'])
 
 STOPWORDS = set(["the","and","or","to","a","of","in","for","is","with","on","that","this"])
+MAX_README_KEYWORDS = 20
+_WORD_RE = re.compile(r"[A-Za-z]+")
+
+# Node classes bound once for exact-type checks in the per-node hot path
+_NAME = ast.Name
+_JSTR = ast.JoinedStr
+_BINOP = ast.BinOp
+_CONST = ast.Constant
+
+_DANGEROUS_BUILTINS = frozenset(('eval', 'exec'))
+_EVAL_SUGGESTION = "Avoid eval/exec; use safe parsers or restricted execution."
+_SQL_FSTRING_MESSAGE = "SQL query constructed with f-string — possible SQL injection."
+_SQL_FSTRING_SUGGESTION = "Use parameterized queries (e.g., placeholders + parameters) instead of f-strings."
+_SQL_CONCAT_MESSAGE = "SQL query built via string concatenation — possible SQL injection."
+_SQL_CONCAT_SUGGESTION = "Use parameterized queries instead."
+
+# DB-API methods are case-sensitive; the capitalised forms cover ADO/COM-style drivers
+_SQL_SINKS = frozenset(('execute', 'executemany', 'Execute', 'ExecuteMany'))
 
 
 class AuditError(Exception):
@@ -60,22 +100,109 @@ def init_project(cwd):
 def _extract_readme_keywords(readme_path):
     if not os.path.exists(readme_path):
         return []
-    text = open(readme_path, 'r', encoding='utf-8').read()
-    words = re.findall(r"[A-Za-z]+", text.lower())
-    keywords = [w for w in words if w not in STOPWORDS]
-    # take top unique keywords
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        text = f.read().lower()
+    # take top unique keywords, tokenizing lazily so long READMEs stop early
     seen = set()
     out = []
-    for w in keywords:
-        if w in seen:
+    for m in _WORD_RE.finditer(text):
+        w = m.group()
+        if w in seen or w in STOPWORDS:
             continue
         seen.add(w)
         out.append(w)
-        if len(out) >= 20:
+        if len(out) >= MAX_README_KEYWORDS:
             break
     return out
 
 
+def _content_hash(data):
+    """Fast content fingerprint used as the audit cache key"""
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _keywords_hash(keywords):
+    # README order is part of the findings (missing-keyword sample, Gemini goals)
+    return hashlib.sha1(','.join(keywords or []).encode('utf-8')).hexdigest()
+
+
+def _rules_hash():
+    """Fingerprint of this module's source, so edited detection rules invalidate the cache"""
+    return _content_hash(Path(__file__).read_bytes())
+
+
+def _file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return _content_hash(f.read())
+    except OSError:
+        return None
+
+
+def _load_cache(state_dir):
+    """Load the per-file audit cache, discarding it if unreadable"""
+    cache = load_json(os.path.join(state_dir, AUDIT_CACHE_FILE))
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _prune_cache(cache):
+    """Drop entries for files that no longer exist; returns how many were removed"""
+    stale = [p for p in cache if not os.path.exists(p)]
+    for p in stale:
+        del cache[p]
+    return len(stale)
+
+
+def _save_cache(state_dir, cache):
+    save_json(os.path.join(state_dir, AUDIT_CACHE_FILE), cache)
+
+
+def _iter_py_files(root):
+    """Yield Python files under root, pruning hidden and common non-code directories"""
+    try:
+        stack = [os.scandir(root)]
+    except OSError:
+        return
+    try:
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop().close()
+                continue
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not name.startswith('.') and name not in IGNORED_DIRS:
+                    try:
+                        stack.append(os.scandir(entry.path))
+                    except OSError:
+                        continue
+            elif name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                yield entry.path
+    finally:
+        for it in stack:
+            it.close()
+
+
+def _readme_keywords(readme_path, state):
+    """README keywords, reused from state.json until the README changes on disk"""
+    try:
+        st = os.stat(readme_path)
+    except OSError:
+        return []
+    key = [st.st_mtime_ns, st.st_size]
+    cached = state.get('readme')
+    if isinstance(cached, dict) and cached.get('path') == readme_path and cached.get('key') == key:
+        return list(cached.get('keywords') or [])
+    keywords = _extract_readme_keywords(readme_path)
+    # Saved with the rest of the state at the end of the audit
+    state['readme'] = {"path": readme_path, "key": key, "keywords": keywords}
+    return keywords
+
+
 def validate_audit_target(path):
     """Validate the audit target and return list of Python files to audit"""
     if not os.path.exists(path):
@@ -88,14 +215,7 @@ def validate_audit_target(path):
             raise AuditError(f"❌ Invalid file type: {path}\n   Only .py files are supported. Got: {os.path.splitext(path)[1]}")
         python_files.append(path)
     elif os.path.isdir(path):
-        # Walk directory to find Python files
-        for root, dirs, files in os.walk(path):
-            # Skip hidden directories and common non-code directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules', 'venv', '.venv', 'env']]
-            
-            for f in files:
-                if f.endswith('.py'):
-                    python_files.append(os.path.join(root, f))
+        python_files = list(_iter_py_files(path))
         
         if not python_files:
             raise AuditError(f"❌ No Python files found in: {path}\n   Make sure the directory contains .py files")
@@ -178,50 +298,89 @@ def get_context_summary(cwd):
     }
 
 
-def audit_file(path, readme_keywords=None):
+def _gemini_analyzer():
+    """Import the Gemini analyzer on first forced use; it pulls in rich and the proxy client"""
+    global _GEMINI
+    if _GEMINI is None:
+        from .gemini_analyzer import analyze_code_security
+        _GEMINI = analyze_code_security
+    return _GEMINI
+
+
+def _mk_issue(file, line, severity, message, suggestion):
+    """Build a local (non-Gemini) finding dict"""
+    return {"file": file, "line": line, "severity": severity, "message": message, "suggestion": suggestion}
+
+
+def _is_str_literal(node):
+    # ast.Str is a deprecated alias that only matches via isinstance; the
+    # real node is a Constant holding a str
+    return node.__class__ is _CONST and node.value.__class__ is str
+
+
+def _check_call(node, issues, path):
+    func = node.func
+    # Attribute carries .attr, Name carries .id; anything else has neither
+    func_name = getattr(func, 'attr', None) or getattr(func, 'id', None)
+
+    # detect use of eval/exec
+    if func.__class__ is _NAME and func_name in _DANGEROUS_BUILTINS:
+        issues.append(_mk_issue(path, node.lineno, "high", f"Use of {func_name}() can be dangerous.", _EVAL_SUGGESTION))
+
+    # detect potential SQL execute with f-strings or concatenation
+    if func_name in _SQL_SINKS and node.args:
+        first = node.args[0]
+        first_type = first.__class__
+        # f-string (the only place f-strings are inspected)
+        if first_type is _JSTR:
+            issues.append(_mk_issue(path, first.lineno, "critical", _SQL_FSTRING_MESSAGE, _SQL_FSTRING_SUGGESTION))
+        # concatenation or formatting
+        elif first_type is _BINOP and (_is_str_literal(first.left) or _is_str_literal(first.right)):
+            issues.append(_mk_issue(path, first.lineno, "high", _SQL_CONCAT_MESSAGE, _SQL_CONCAT_SUGGESTION))
+
+
+# Read-only checks keyed by exact node class; each takes (node, issues, path)
+_HANDLERS = {ast.Call: _check_call}
+
+
+def _run_checks(tree, issues, path):
+    """Walk the tree once, dispatching each node to its check by class"""
+    handlers = _HANDLERS
+    for node in ast.walk(tree):
+        handler = handlers.get(node.__class__)
+        if handler is not None:
+            handler(node, issues, path)
+    # ast.walk is breadth-first; report findings in source order
+    issues.sort(key=itemgetter('line'))
+
+
+def _parse_error(path, e):
+    return {"severity": "error", "message": f"Failed to parse: {e}", "file": path}
+
+
+def audit_file(path, readme_keywords=None, force_gemini=False):
+    try:
+        raw = Path(path).read_bytes()
+    except Exception as e:
+        return [_parse_error(path, e)]
+    return _audit_bytes(path, raw, readme_keywords, force_gemini)
+
+
+def _audit_bytes(path, raw, readme_keywords=None, force_gemini=False):
     issues = []
     try:
-        src = open(path, 'r', encoding='utf-8').read()
-        tree = ast.parse(src, filename=path)
+        # The parser takes bytes directly; decode only when text is needed below
+        tree = ast.parse(raw, filename=path)
     except Exception as e:
-        issues.append({"severity": "error", "message": f"Failed to parse: {e}", "file": path})
+        issues.append(_parse_error(path, e))
         return issues
 
-    class Visitor(ast.NodeVisitor):
-        def visit_Call(self, node):
-            # detect use of eval/exec
-            if isinstance(node.func, ast.Name) and node.func.id in ('eval', 'exec'):
-                issues.append({"file": path, "line": node.lineno, "severity": "high", "message": f"Use of {node.func.id}() can be dangerous.", "suggestion": "Avoid eval/exec; use safe parsers or restricted execution."})
-
-            # detect potential SQL execute with f-strings or concatenation
-            func_name = None
-            if isinstance(node.func, ast.Attribute):
-                func_name = node.func.attr
-            elif isinstance(node.func, ast.Name):
-                func_name = node.func.id
-
-            if func_name and func_name.lower() in ('execute', 'executemany'):
-                if node.args:
-                    first = node.args[0]
-                    # f-string
-                    if isinstance(first, ast.JoinedStr):
-                        issues.append({"file": path, "line": first.lineno, "severity": "critical", "message": "SQL query constructed with f-string — possible SQL injection.", "suggestion": "Use parameterized queries (e.g., placeholders + parameters) instead of f-strings."})
-                    # concatenation or formatting
-                    if isinstance(first, ast.BinOp) and (isinstance(first.left, ast.Str) or isinstance(first.right, ast.Str)):
-                        issues.append({"file": path, "line": first.lineno, "severity": "high", "message": "SQL query built via string concatenation — possible SQL injection.", "suggestion": "Use parameterized queries instead."})
-            self.generic_visit(node)
-
-        def visit_JoinedStr(self, node):
-            # f-string usage detection (standalone)
-            # Could be benign; flag when used in suspicious contexts in visit_Call above.
-            self.generic_visit(node)
-
-    Visitor().visit(tree)
+    _run_checks(tree, issues, path)
 
     # simple alignment check: ensure README keywords appear in source
     alignment_issues = []
     if readme_keywords:
-        text_lower = src.lower()
+        text_lower = raw.decode('utf-8', 'replace').lower()
         missing = [k for k in readme_keywords if k not in text_lower]
         if missing:
             alignment_issues.append({"file": path, "severity": "medium", "message": "Potential misalignment with README goals.", "details": {"missing_keywords_sample": missing[:5]}})
@@ -230,19 +389,14 @@ def audit_file(path, readme_keywords=None):
 
     # Optionally call Gemini for deeper analysis if configured
     try:
-        from .gemini_analyzer import analyze_code_security
-        from dotenv import load_dotenv
-        load_dotenv()
-        force = False
-        if os.getenv('KYLO_FORCE_GEMINI', '0') == '1':
-            force = True
-        if force:
+        if force_gemini:
+            analyze_code_security = _gemini_analyzer()
             context = {
-                'goals': readme_keywords or [],
+                'goals': list(readme_keywords or []),
                 'file': path
             }
             try:
-                gemini_issues = analyze_code_security(src, context, force=force)
+                gemini_issues = analyze_code_security(raw.decode('utf-8', 'replace'), context)
                 # Tag Gemini issues and append
                 for gi in gemini_issues:
                     gi['source'] = 'gemini'
@@ -261,7 +415,42 @@ def audit_file(path, readme_keywords=None):
     return merged
 
 
-def audit_path(path):
+def _scan_worker(path, readme_keywords=None, force_gemini=False):
+    """Audit a single file, returning (issues, error, content_hash) so one failure doesn't abort a batch"""
+    try:
+        try:
+            raw = Path(path).read_bytes()
+        except Exception as e:
+            return [_parse_error(path, e)], None, None
+        # Hash the bytes that were parsed so a cache entry always matches its findings
+        return _audit_bytes(path, raw, readme_keywords, force_gemini), None, _content_hash(raw)
+    except Exception as e:
+        return None, str(e), None
+
+
+def _scan_files(paths, readme_keywords=None, force_gemini=False):
+    """Audit paths in order, spreading the work over a process pool for large batches"""
+    worker = partial(_scan_worker, readme_keywords=readme_keywords, force_gemini=force_gemini)
+    # Gemini analysis is network-bound and prints, so it stays in-process
+    cpus = os.cpu_count() or 1
+    if len(paths) <= PARALLEL_THRESHOLD or force_gemini or cpus <= 1:
+        return [worker(p) for p in paths]
+    # About four chunks per worker balances uneven files against IPC overhead,
+    # and no worker is spawned without a chunk to run
+    chunksize = max(1, len(paths) // (cpus * 4))
+    workers = min(cpus, -(-len(paths) // chunksize))
+    try:
+        # spawn, not fork: the CLI calls this under a live rich Progress whose
+        # refresh thread must not be forked
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            return list(executor.map(worker, paths, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # No usable process pool here (e.g. no POSIX semaphores) or a worker died
+        return [worker(p) for p in paths]
+
+
+def audit_path(path, use_cache=True):
     path = os.path.abspath(path)
     cwd = os.getcwd()
     
@@ -272,14 +461,27 @@ def audit_path(path):
         print(str(e))
         return {"error": str(e), "scanned": [], "summary": {"files": 0, "issues": 0}}
     
-    readme = os.path.join(cwd, 'README.md')
-    keywords = _extract_readme_keywords(readme)
+    # Read .env once per audit
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    force_gemini = os.getenv('KYLO_FORCE_GEMINI', '0') == '1'
+    # Cached results carry no Gemini findings, and Gemini findings must not
+    # leak into later local-only runs
+    if force_gemini:
+        use_cache = False
 
     state_dir = os.path.join(cwd, STATE_DIR_NAME)
     os.makedirs(state_dir, exist_ok=True)
     state_path = os.path.join(state_dir, STATE_FILE)
     state = load_json(state_path) or {"files": {}, "generated": time.time()}
 
+    readme = os.path.join(cwd, 'README.md')
+    # One immutable, README-ordered keyword tuple is shared by every audit_file call
+    keywords = tuple(_readme_keywords(readme, state))
+
     # Show context summary if available
     context_summary = get_context_summary(cwd)
     if context_summary:
@@ -291,28 +493,67 @@ def audit_path(path):
     report = {"scanned": [], "summary": {"files": 0, "issues": 0}}
     files_audited = {}
 
+    # Per-file results are reused while content, tool version, detection
+    # rules and README keywords are unchanged.
+    cache = _load_cache(state_dir) if use_cache else {}
+    keywords_hash = _keywords_hash(keywords)
+    rules_hash = _rules_hash() if use_cache else None
+
     print(f"🔍 Scanning {len(targets)} Python file(s)...\n")
 
+    # Resolve cache hits first so only changed files are handed to the scanner
+    pending = []
+    results = {}
+    scanned_at = {}
     for t in targets:
-        try:
-            issues = audit_file(t, readme_keywords=keywords)
-            state['files'][t] = {"last_scanned": time.time(), "issues": issues}
-            report['scanned'].append({"file": t, "issues_count": len(issues)})
-            report['summary']['files'] += 1
-            report['summary']['issues'] += len(issues)
-            files_audited[t] = len(issues)
-            
-            # Print per-file summary
-            if len(issues) > 0:
-                print(f"❌ {t}: {len(issues)} issue(s) found")
-            else:
-                print(f"✅ {t}: No issues detected")
-        except Exception as e:
-            print(f"⚠️  Error scanning {t}: {e}")
+        entry = cache.get(t)
+        if (entry
+                and entry.get('tool_version') == __version__
+                and entry.get('rules_hash') == rules_hash
+                and entry.get('keywords_hash') == keywords_hash
+                and entry.get('hash') == _file_hash(t)):
+            results[t] = (entry['issues'], None)
+            # Time of the scan that produced the cached findings
+            scanned_at[t] = entry.get('scanned_at') or state['files'].get(t, {}).get('last_scanned', time.time())
+        else:
+            pending.append(t)
+
+    for t, (issues, error, scanned_hash) in zip(pending, _scan_files(pending, keywords, force_gemini)):
+        results[t] = (issues, error)
+        scanned_at[t] = time.time()
+        if use_cache and error is None and scanned_hash is not None:
+            cache[t] = {
+                "hash": scanned_hash,
+                "tool_version": __version__,
+                "rules_hash": rules_hash,
+                "keywords_hash": keywords_hash,
+                "scanned_at": scanned_at[t],
+                "issues": issues
+            }
+
+    for t in targets:
+        issues, error = results[t]
+        if error is not None:
+            print(f"⚠️  Error scanning {t}: {error}")
             continue
 
+        state['files'][t] = {"last_scanned": scanned_at[t], "issues": issues}
+        report['scanned'].append({"file": t, "issues_count": len(issues)})
+        report['summary']['files'] += 1
+        report['summary']['issues'] += len(issues)
+        files_audited[t] = len(issues)
+
+        # Print per-file summary
+        if len(issues) > 0:
+            print(f"❌ {t}: {len(issues)} issue(s) found")
+        else:
+            print(f"✅ {t}: No issues detected")
+
     state['generated'] = time.time()
     save_json(state_path, state)
+    # Only rewrite the index when this run added or removed entries
+    if use_cache and (_prune_cache(cache) or pending):
+        _save_cache(state_dir, cache)
     
     # Update context with this audit
     update_context(cwd, files_audited, report['summary']['issues'])
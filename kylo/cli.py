@@ -2,19 +2,14 @@ import os
 import json
 import time
 import click
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
 from pathlib import Path
 
 from .auditor import init_project, audit_path, secure_target, AuditError
-from .readme_manager import create_readme_interactive
-from .secure_storage import SecureStorage
-from .usage_tracker import UsageTracker
+from .utils import get_console
 
-console = Console()
+console = get_console()
 
 # Apply color preferences from environment
 PRIMARY = os.getenv('KYLO_CLI_PRIMARY_COLOR', 'magenta')
@@ -53,6 +48,8 @@ def cli(ctx, verbose):
 @click.pass_context
 def init(ctx, path):
     """Initialize kylo in the current project"""
+    from .readme_manager import create_readme_interactive
+
     print_banner()
     
     with Progress(
@@ -67,9 +64,6 @@ def init(ctx, path):
         kylo_dir = kylo_root / '.kylo'
         kylo_dir.mkdir(parents=True, exist_ok=True)
         
-        progress.update(task, description=f"[{PRIMARY}]Creating .kylo directory...")
-        time.sleep(0.5)
-        
         readme = kylo_root / 'README.md'
         if not readme.exists():
             progress.update(task, description=f"[{PRIMARY}]Creating README.md...")
@@ -103,6 +97,8 @@ def config():
 @click.pass_context
 def set_api_key(ctx, service, key):
     """Securely store an API key for a named service"""
+    from .secure_storage import SecureStorage
+
     kylo_root = Path(os.getcwd())
     ss = SecureStorage(kylo_root)
     
@@ -127,7 +123,6 @@ def set_api_key(ctx, service, key):
     ) as progress:
         task = progress.add_task(f"[{PRIMARY}]Encrypting and storing key...", total=None)
         ss.store_api_key(service, key)
-        time.sleep(0.3)
     
     console.print(f"[green]✓ API key for {service} stored securely[/green]")
 
@@ -136,6 +131,9 @@ def set_api_key(ctx, service, key):
 @click.pass_context
 def list_keys(ctx):
     """List services that have API keys stored"""
+    from rich.table import Table
+    from .secure_storage import SecureStorage
+
     kylo_root = Path(os.getcwd())
     ss = SecureStorage(kylo_root)
     
@@ -169,6 +167,8 @@ def list_keys(ctx):
 @click.pass_context
 def set_admin_token(ctx, token):
     """Set or overwrite the admin token"""
+    from .secure_storage import SecureStorage
+
     kylo_root = Path(os.getcwd())
     ss = SecureStorage(kylo_root)
     
@@ -179,7 +179,6 @@ def set_admin_token(ctx, token):
     ) as progress:
         task = progress.add_task(f"[{PRIMARY}]Securing admin token...", total=None)
         ss.set_admin_token(token)
-        time.sleep(0.3)
     
     console.print(Panel(
         "[green]✓ Admin token set successfully[/green]\n\n"
@@ -193,6 +192,9 @@ def set_admin_token(ctx, token):
 @click.pass_context
 def stats(ctx):
     """Show usage statistics"""
+    from rich.table import Table
+    from .usage_tracker import UsageTracker
+
     kylo_root = Path(os.getcwd())
     tracker = UsageTracker(kylo_root)
     report = tracker.get_usage_report()
@@ -225,6 +227,7 @@ def stats(ctx):
 @click.pass_context
 def context(ctx):
     """View audit history and context"""
+    from rich.table import Table
     from .auditor import get_context_summary
     from .utils import load_json
     
@@ -321,8 +324,9 @@ def context(ctx):
 
 @cli.command()
 @click.argument('target', required=False)
+@click.option('--no-cache', is_flag=True, help='Re-scan every file, ignoring cached results')
 @click.pass_context
-def audit(ctx, target=None):
+def audit(ctx, target=None, no_cache=False):
     """Audit a file or directory"""
     print_banner()
     
@@ -347,13 +351,8 @@ def audit(ctx, target=None):
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            task = progress.add_task(f"[{PRIMARY}]🔍 Analyzing target...", total=None)
-            
-            progress.update(task, description=f"[{PRIMARY}]📂 Validating files...")
-            time.sleep(0.3)
-            
-            progress.update(task, description=f"[{PRIMARY}]🔍 Running security checks...")
-            report = audit_path(target_path)
+            task = progress.add_task(f"[{PRIMARY}]🔍 Running security checks...", total=None)
+            report = audit_path(target_path, use_cache=not no_cache)
             
             # Check for errors
             if "error" in report:
@@ -416,13 +415,7 @@ def secure(ctx, target):
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            task = progress.add_task(f"[{PRIMARY}]🔒 Initializing security scanner...", total=None)
-            time.sleep(0.3)
-            
-            progress.update(task, description=f"[{PRIMARY}]🔍 Deep code analysis...")
-            time.sleep(0.5)
-            
-            progress.update(task, description=f"[{PRIMARY}]🛡️ Checking vulnerabilities...")
+            task = progress.add_task(f"[{PRIMARY}]🛡️ Checking vulnerabilities...", total=None)
             secure_target(target)
             
             progress.update(task, description=f"[{ACCENT}]✓ Security scan complete!")
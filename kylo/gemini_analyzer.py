@@ -1,10 +1,10 @@
 """Gemini API integration for deep code analysis"""
 import os
 from typing import Dict, List, Any
-from rich.console import Console
 from dotenv import load_dotenv
+from .utils import get_console
 
-console = Console()
+console = get_console()
 load_dotenv()
 
 # The production URL for the Kylo proxy server. This is hardcoded.
@@ -1,11 +1,10 @@
 import os
-from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.prompt import Prompt, Confirm
-from .utils import load_json, save_json
+from .utils import load_json, save_json, get_console
 
-console = Console()
+console = get_console()
 
 README_TEMPLATE = """# {project_name}
 
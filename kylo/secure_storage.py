@@ -9,9 +9,9 @@ from typing import Any, Dict, Optional
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from rich.console import Console
+from .utils import get_console
 
-console = Console()
+console = get_console()
 
 class SecureStorage:
     """Handles encrypted storage of sensitive data"""
@@ -6,9 +6,9 @@ from typing import Dict, List, Optional
 from pathlib import Path
 from .secure_storage import SecureStorage
 from .usage_tracker import UsageTracker
-from rich.console import Console
+from .utils import get_console
 
-console = Console()
+console = get_console()
 
 class SecurityScanner:
     def __init__(self, kylo_root: Path, mode: str = 'aggressive'):
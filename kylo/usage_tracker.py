@@ -17,7 +17,6 @@ class UsageTracker:
         # Initialize rate limiting, reading from env vars for creator control.
         # API limit (KYLO_RATE_LIMIT_API) specifies how many Gemini/LLM requests
         # or other outbound API calls Kylo will make per hour. Default is 1000.
-        import os
         self.rate_limits = {
             'audit': int(os.getenv('KYLO_RATE_LIMIT_AUDITS', '100')),
             'secure': int(os.getenv('KYLO_RATE_LIMIT_SECURE', '50')),
@@ -1,18 +1,62 @@
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared rich Console, created on first use so non-UI callers never import rich
+_console = None
+
+
+def get_console():
+    """Return the process-wide Console used by the CLI and its helper modules"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 def load_json(path):
     try:
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Files written by the stdlib encoder may hold NaN/Infinity
+                return json.loads(raw)
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception:
         return None
 
 
+def _dumps(data):
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits from Gemini findings; orjson
+            # reads those back as floats, which is fine for report data
+            pass
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
 def save_json(path, data):
     d = os.path.dirname(path)
     if d and not os.path.exists(d):
         os.makedirs(d, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Write to a sibling temp file and rename so readers never see a partial file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(data))
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -18,7 +18,10 @@ import typing as t
 import logging
 from logging.config import dictConfig
 
+import orjson
 import redis
+import redis.asyncio as aioredis
+import google.generativeai as genai
 from fastapi import FastAPI, Header, HTTPException, Request
 from pydantic import BaseModel
 from python_json_logger import jsonlogger
@@ -70,12 +73,33 @@ if not all([PROXY_KEY, REDIS_URL]):
     # For now, we log a critical error and continue, but some features will fail.
 
 # --- Redis Connection for Rate Limiting ---
+# The asyncio client keeps Redis calls from blocking the event loop
 try:
-    redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+    redis_client = aioredis.from_url(REDIS_URL) if REDIS_URL else None
 except redis.exceptions.ConnectionError as e:
     logger.critical(f"Could not connect to Redis at {REDIS_URL}. Rate limiting will not work. Error: {e}")
     redis_client = None
 
+# INCR and first-hit EXPIRE run as one atomic script: a single round-trip per request
+RATE_LIMIT_SCRIPT = (
+    "local c = redis.call('INCR', KEYS[1]) "
+    "if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    "return c"
+)
+rate_limit_script = redis_client.register_script(RATE_LIMIT_SCRIPT) if redis_client else None
+
+# --- Gemini Client ---
+# Configured once at import so requests only await the model call
+if PROXY_KEY:
+    genai.configure(api_key=PROXY_KEY)
+gemini_model = genai.GenerativeModel('gemini-pro')
+
+PROMPT_TEMPLATE = (
+    "Analyze the following code for security vulnerabilities. Return the output as a JSON object "
+    "with a single key 'issues', which is an array of objects. Each object should have 'severity', "
+    "'description', and 'file_path' keys.\n\nCODE:\n```\n{code}\n```\n\nCONTEXT:\n{ctx}"
+)
+
 # --- Pydantic Models ---
 class AnalyzeRequest(BaseModel):
     code: str
@@ -95,9 +119,7 @@ async def rate_limit_by_ip(request: Request):
     key = f"rate_limit:{ip_address}:{current_hour}"
     
     try:
-        current_count = redis_client.incr(key)
-        if current_count == 1:
-            redis_client.expire(key, 3600) # Expire key after 1 hour
+        current_count = await rate_limit_script(keys=[key], args=[3600]) # Expire key after 1 hour
         
         if current_count > RATE_LIMIT_PER_HOUR:
             logger.warning(f"Rate limit exceeded for IP: {ip_address}")
@@ -134,21 +156,24 @@ async def analyze(req: AnalyzeRequest, request: Request):
         raise HTTPException(status_code=503, detail="Analysis service is not configured.")
 
     try:
-        # Using requests for a more robust HTTP call with timeouts
-        import google.generativeai as genai
-        genai.configure(api_key=PROXY_KEY)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        prompt = f"Analyze the following code for security vulnerabilities. Return the output as a JSON object with a single key 'issues', which is an array of objects. Each object should have 'severity', 'description', and 'file_path' keys.\n\nCODE:\n```\n{req.code}\n```\n\nCONTEXT:\n{req.context}"
+        prompt = PROMPT_TEMPLATE.format(code=req.code, ctx=req.context)
         
-        response = model.generate_content(prompt)
+        # Awaiting the async call frees the event loop for other requests
+        # while Gemini is working
+        response = await gemini_model.generate_content_async(prompt)
         
         # Basic parsing of Gemini's response
         # This part needs to be very robust in a real application
-        response_text = response.text.strip().lstrip('```json').rstrip('```')
+        # Strip an optional ``` / ```json fence
+        response_text = response.text.strip()
+        for fence in ('```json', '```'):
+            if response_text.startswith(fence):
+                response_text = response_text[len(fence):]
+                break
+        if response_text.endswith('```'):
+            response_text = response_text[:-3]
         
-        import json
-        data = json.loads(response_text)
+        data = orjson.loads(response_text)
         issues = data.get('issues', [])
         
         logger.info(f"Analysis successful for IP {request.client.host}, found {len(issues)} issues.")
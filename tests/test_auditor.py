@@ -0,0 +1,170 @@
+from kylo import auditor
+from kylo.auditor import AUDIT_CACHE_FILE, STATE_DIR_NAME, STATE_FILE, _content_hash, audit_file, audit_path
+from kylo.utils import load_json
+
+
+def _audit(tmp_path, source, keywords=None):
+    target = tmp_path / "target.py"
+    target.write_text(source, encoding="utf-8")
+    return audit_file(str(target), readme_keywords=keywords)
+
+
+def _record_scans(monkeypatch):
+    """Record the paths handed to the scanner on each audit_path run"""
+    scanned = []
+    real = auditor._scan_files
+
+    def scan_files(paths, *args, **kwargs):
+        scanned.append(list(paths))
+        return real(paths, *args, **kwargs)
+
+    monkeypatch.setattr(auditor, "_scan_files", scan_files)
+    return scanned
+
+
+def _cached_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "README.md").write_text("Token cache\n", encoding="utf-8")
+    src = tmp_path / "src"
+    src.mkdir()
+    target = src / "app.py"
+    target.write_text("eval(x)\n", encoding="utf-8")
+    audit_path(str(src))
+    return src, target
+
+
+def _by_severity(issues, severity):
+    return [i for i in issues if i["severity"] == severity]
+
+
+def test_eval_and_exec_are_flagged(tmp_path):
+    issues = _audit(tmp_path, "x = eval(data)\nexec(code)\n")
+    high = _by_severity(issues, "high")
+    assert [(i["line"], i["message"]) for i in high] == [
+        (1, "Use of eval() can be dangerous."),
+        (2, "Use of exec() can be dangerous."),
+    ]
+
+
+def test_sql_fstring_and_concatenation_are_flagged(tmp_path):
+    source = (
+        "cur.execute(f\"SELECT * FROM t WHERE id = {uid}\")\n"
+        "cur.execute(\"SELECT * FROM t WHERE id = \" + uid)\n"
+        "cur.execute(\"SELECT * FROM t WHERE id = ?\", (uid,))\n"
+    )
+    issues = _audit(tmp_path, source)
+    assert [(i["line"], i["severity"]) for i in issues] == [(1, "critical"), (2, "high")]
+
+
+def test_findings_are_reported_in_source_order(tmp_path):
+    source = "def f():\n    return eval(a)\n\nexec(b)\ncur.execute(f\"{q}\")\n"
+    issues = _audit(tmp_path, source)
+    assert [i["line"] for i in issues] == [2, 4, 5]
+
+
+def test_syntax_error_is_reported_as_parse_error(tmp_path):
+    issues = _audit(tmp_path, "def broken(:\n")
+    assert len(issues) == 1
+    assert issues[0]["severity"] == "error"
+    assert issues[0]["message"].startswith("Failed to parse:")
+
+
+def test_missing_readme_keywords_keep_readme_order(tmp_path):
+    issues = _audit(tmp_path, "def handle_user(): pass\n", ["token", "user", "audit", "cache"])
+    alignment = _by_severity(issues, "medium")
+    assert len(alignment) == 1
+    assert alignment[0]["details"]["missing_keywords_sample"] == ["token", "audit", "cache"]
+
+
+def test_overlapping_keywords_count_as_present(tmp_path):
+    issues = _audit(tmp_path, "USERVER = 'apipeline'\n", ["user", "server", "api", "pipeline"])
+    assert _by_severity(issues, "medium") == []
+
+
+def test_cache_entry_hashes_the_scanned_bytes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    src = tmp_path / "src"
+    src.mkdir()
+    target = src / "app.py"
+    target.write_bytes(b"eval(x)\n")
+
+    audit_path(str(src))
+    cache = load_json(str(tmp_path / STATE_DIR_NAME / AUDIT_CACHE_FILE))
+    entry = cache[str(target)]
+    assert entry["hash"] == _content_hash(target.read_bytes())
+    assert [i["line"] for i in entry["issues"]] == [1]
+
+
+def test_readme_keywords_persist_until_readme_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+    readme = tmp_path / "README.md"
+    readme.write_text("Token cache\n", encoding="utf-8")
+    state_path = str(tmp_path / STATE_DIR_NAME / STATE_FILE)
+
+    audit_path(str(tmp_path / "app.py"))
+    assert load_json(state_path)["readme"]["keywords"] == ["token", "cache"]
+
+    readme.write_text("Audit pipeline goals\n", encoding="utf-8")
+    audit_path(str(tmp_path / "app.py"))
+    assert load_json(state_path)["readme"]["keywords"] == ["audit", "pipeline", "goals"]
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    scanned = _record_scans(monkeypatch)
+
+    report = audit_path(str(src))
+    assert scanned == [[]]
+    assert report["summary"]["issues"] == 2
+
+
+def test_edited_file_is_rescanned(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    scanned = _record_scans(monkeypatch)
+
+    target.write_text("exec(x)\neval(y)\n", encoding="utf-8")
+    audit_path(str(src))
+    assert scanned == [[str(target)]]
+
+
+def test_reordered_readme_keywords_rescan(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    scanned = _record_scans(monkeypatch)
+
+    (tmp_path / "README.md").write_text("Cache token\n", encoding="utf-8")
+    audit_path(str(src))
+    assert scanned == [[str(target)]]
+    state = load_json(str(tmp_path / STATE_DIR_NAME / STATE_FILE))
+    alignment = _by_severity(state["files"][str(target)]["issues"], "medium")
+    assert alignment[0]["details"]["missing_keywords_sample"] == ["cache", "token"]
+
+
+def test_changed_rules_rescan(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    scanned = _record_scans(monkeypatch)
+
+    monkeypatch.setattr(auditor, "_rules_hash", lambda: "edited-rules")
+    audit_path(str(src))
+    assert scanned == [[str(target)]]
+
+
+def test_use_cache_false_rescans(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    scanned = _record_scans(monkeypatch)
+
+    audit_path(str(src), use_cache=False)
+    assert scanned == [[str(target)]]
+
+
+def test_deleted_file_entry_is_pruned(tmp_path, monkeypatch):
+    src, target = _cached_project(tmp_path, monkeypatch)
+    other = src / "other.py"
+    other.write_text("x = 1\n", encoding="utf-8")
+    audit_path(str(src))
+    cache_path = str(tmp_path / STATE_DIR_NAME / AUDIT_CACHE_FILE)
+    assert str(other) in load_json(cache_path)
+
+    other.unlink()
+    audit_path(str(src))
+    assert set(load_json(cache_path)) == {str(target)}